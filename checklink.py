@@ -27,18 +27,27 @@ Examples:
     python checklink.py https://site.com --openai-key "sk-..." --delay 0.5
 """
 
-import requests
+import asyncio
+import hashlib
+import httpx
 import re
 import time
 import logging
-import json
-from urllib.parse import urljoin, urlparse, parse_qs
-from bs4 import BeautifulSoup
-from typing import List, Dict, Tuple, Optional
+import orjson
+import threading
+from collections import Counter, OrderedDict, deque
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import urljoin, urlparse, parse_qs, unquote_plus, urlsplit, urlunsplit
+from bs4 import BeautifulSoup, SoupStrainer
+from lxml import etree, html as lxml_html
+import soupsieve
+from typing import List, Dict, Tuple, Optional, Iterator, Set
 import argparse
-from dataclasses import dataclass
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
 from reportlab.lib.pagesizes import A4
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
+from reportlab.platypus import SimpleDocTemplate, LongTable, TableStyle, Paragraph, Spacer
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib import colors
 from reportlab.lib.units import inch
@@ -47,8 +56,113 @@ import os
 from datetime import datetime
 from pathlib import Path
 
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    # selectolax is an optional speed-up; BeautifulSoup covers the same paths
+    LexborHTMLParser = None
 
-@dataclass
+try:
+    import ahocorasick
+except ImportError:
+    # pyahocorasick is an optional speed-up; KeywordMatcher falls back to one substring scan per keyword
+    ahocorasick = None
+
+try:
+    import hishel
+    from hishel.httpx import SyncCacheTransport
+except ImportError:
+    # hishel is optional; without it every run fetches every link from the network
+    hishel = None
+
+# Content analysis only looks at the start of a page, so bodies are read up to this size
+MAX_BODY_BYTES = 200_000
+
+# Crawled pages are read further so links near the end of large pages are still found
+MAX_PAGE_BYTES = 2_000_000
+
+# Links whose Content-Length exceeds this are only status-checked, never downloaded for analysis
+MAX_CONTENT_LENGTH = 2_000_000
+
+# The AI sees only this many characters of a page
+AI_CONTENT_CHARS = 2000
+
+# Analyses kept per run, keyed by page content, so repeated pages are analyzed once
+ANALYSIS_CACHE_SIZE = 4096
+
+# Connection pool size; HTTP/2 multiplexes same-host requests over one connection, so few are kept alive
+POOL_MAX_CONNECTIONS = 100
+POOL_MAX_KEEPALIVE = 20
+
+# Responses in the on-disk HTTP cache are reused across runs for up to this many seconds
+HTTP_CACHE_TTL = 3600
+HTTP_CACHE_FILE = 'httpcache.sqlite'
+
+# Kept apart from the reports, so output directories hold nothing but reports
+HTTP_CACHE_DIR = Path('.checklink_cache') / 'http'
+
+# A cached page left partly read is read on for at most this many seconds so it can be stored
+HTTP_CACHE_DRAIN_TIMEOUT = 10.0
+
+# Status codes returned by servers that do not implement HEAD
+HEAD_UNSUPPORTED_CODES = (405, 501)
+
+# Query parameters that only track the visitor and never change the page served
+TRACKING_PARAMS = {
+    'utm_source', 'utm_medium', 'utm_campaign', 'utm_term', 'utm_content',
+    'fbclid', 'gclid', 'dclid', 'msclkid', 'mc_cid', 'mc_eid', '_ga'
+}
+
+# Ports implied by the scheme, dropped so 'host:443' and 'host' are the same page
+DEFAULT_PORTS = {'http': ':80', 'https': ':443'}
+
+# Scam indicators
+SCAM_KEYWORDS = [
+    'get rich quick', 'guaranteed money', 'click here now',
+    'limited time offer', 'act now', 'free money',
+    'congratulations you won', 'urgent action required',
+    'online casino', 'paypal casino', 'casino bonus', 'casino mit paypal',
+    'paypal online casinos', 'fintech news', 'seröse expertenmeinungen',
+    'vertrauenswürdigsten paypal online casinos', 'ppc24'
+]
+
+# Embassy/Mozambique relevance keywords
+EMBASSY_KEYWORDS = [
+    'embassy', 'consulate', 'mozambique', 'maputo', 'visa', 'passport',
+    'diplomatic', 'consular', 'embassy services', 'citizen services',
+    'travel document', 'mozambican', 'diplomatic mission'
+]
+
+
+# Common language switcher patterns
+LANGUAGE_SELECTORS = [
+    'a[href*="lang="]',
+    '.language-switcher a',
+    '.lang-switcher a',
+    '.qtranxs_language_chooser a',
+    '.language-selector a',
+    '[class*="language"] a[href*="lang"]'
+]
+
+# Compiled once and combined, so the homepage DOM is walked a single time
+LANGUAGE_LINK_SELECTOR = soupsieve.compile(', '.join(LANGUAGE_SELECTORS))
+
+# Only <a href> tags are built when BeautifulSoup extracts links without selectolax
+LINK_STRAINER = SoupStrainer('a', href=True)
+
+# Meta description used as the website goal; compiled once, matched case-insensitively
+META_DESCRIPTION_SELECTOR = soupsieve.compile('meta[name="description" i]')
+
+# Text nodes outside <script> and <style>, for the lxml text extraction fallback
+VISIBLE_TEXT_XPATH = etree.XPath('//text()[not(ancestor::script or ancestor::style)]')
+
+
+def _clip(text: str, length: int) -> str:
+    """Truncate text to length characters, marking the cut with an ellipsis"""
+    return text if len(text) <= length else f"{text[:length]}..."
+
+
+@dataclass(slots=True)
 class LinkResult:
     """Data class to store link analysis results"""
     title: str
@@ -57,9 +171,18 @@ class LinkResult:
     reason: str
     content_snippet: str = ""
     language: str = "unknown"
+    # Truncated copies for report table cells, computed once per result
+    display_title: str = field(init=False, repr=False, compare=False)
+    display_url: str = field(init=False, repr=False, compare=False)
+    display_reason: str = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self.display_title = _clip(self.title, 50)
+        self.display_url = _clip(self.url, 60)
+        self.display_reason = _clip(self.reason, 80)
 
 
-@dataclass
+@dataclass(slots=True)
 class LanguageVersion:
     """Data class to store language version information"""
     code: str
@@ -67,24 +190,344 @@ class LanguageVersion:
     url: str
 
 
+def _canonical(url: str) -> str:
+    """Normalize a URL so variants of the same page share one visited/cache entry"""
+    parts = urlsplit(url)
+    # Parameters are kept exactly as written ('?print' stays valueless) and sorted stably by name only,
+    # so repeated parameters keep their order and the URL still means the same thing when fetched
+    params = [param for param in parts.query.split('&') if param]
+    query = '&'.join(sorted(
+        (param for param in params if unquote_plus(param.partition('=')[0]).lower() not in TRACKING_PARAMS),
+        key=lambda param: unquote_plus(param.partition('=')[0])
+    ))
+    
+    # Only the host is case-insensitive; userinfo such as a password is kept as written
+    scheme = parts.scheme.lower()
+    userinfo, at, host = parts.netloc.rpartition('@')
+    host = host.lower()
+    default_port = DEFAULT_PORTS.get(scheme)
+    if default_port and host.endswith(default_port):
+        host = host[:-len(default_port)]
+    return urlunsplit((scheme, userinfo + at + host, parts.path or '/', query, ''))
+
+
+def _url_key(url: str) -> int:
+    """Return a compact 64-bit key for a canonical URL, for large visited sets
+    
+    '/about' and '/about/' share a key; the slash is kept in the URL itself, since it changes how
+    relative links on the page resolve.
+    """
+    parts = urlsplit(url)
+    url = urlunsplit(parts._replace(path=parts.path.rstrip('/') or '/'))
+    return int.from_bytes(hashlib.blake2b(url.encode(), digest_size=8).digest(), 'big')
+
+
+def _extract_anchors(content: bytes) -> List[Tuple[str, str]]:
+    """Return (href, title) pairs for every <a href> in an HTML document"""
+    anchors = []
+    if LexborHTMLParser is not None:
+        for link in LexborHTMLParser(content).css('a[href]'):
+            href = link.attributes.get('href') or ''
+            title = link.text(strip=True) or link.attributes.get('title') or href
+            anchors.append((href, title))
+    else:
+        for link in BeautifulSoup(content, 'lxml', parse_only=LINK_STRAINER).find_all('a', href=True):
+            href = link.get('href')
+            title = link.get_text(strip=True) or link.get('title', '') or href
+            anchors.append((href, title))
+    return anchors
+
+
+def _extract_text(content: bytes) -> str:
+    """Return the visible text of an HTML document, without scripts and styles"""
+    if LexborHTMLParser is not None:
+        tree = LexborHTMLParser(content)
+        for node in tree.css('script, style'):
+            node.decompose()
+        return tree.body.text(separator=' ') if tree.body else ''
+    
+    # One compiled XPath pass in C, without mutating the tree or building a BeautifulSoup tree
+    try:
+        return ' '.join(VISIBLE_TEXT_XPATH(lxml_html.fromstring(content)))
+    except etree.ParserError:
+        # Empty, whitespace-only or comment-only documents have no text, as with the other parsers
+        return ''
+
+
+def _is_html(response: httpx.Response) -> bool:
+    """Whether a response is HTML, treating a missing Content-Type as HTML"""
+    content_type = response.headers.get('Content-Type', '')
+    return not content_type or 'html' in content_type.lower()
+
+
+def _is_too_large(response: httpx.Response) -> bool:
+    """Whether a response declares a Content-Length above MAX_CONTENT_LENGTH"""
+    try:
+        return int(response.headers.get('Content-Length', 0)) > MAX_CONTENT_LENGTH
+    except ValueError:
+        return False
+
+
+def _read_html_body(response: httpx.Response, max_bytes: int) -> Optional[bytes]:
+    """Read at most max_bytes of a streamed response, or None when it is not HTML"""
+    if not _is_html(response):
+        return None
+    
+    body = bytearray()
+    for chunk in response.iter_bytes():
+        body += chunk
+        if len(body) >= max_bytes:
+            break
+    return bytes(body[:max_bytes])
+
+
+class KeywordMatcher:
+    """Find which of a fixed set of keywords occur in a text, with a single pass over it when
+    pyahocorasick is installed and one substring scan per keyword otherwise"""
+    
+    def __init__(self, keywords: List[str]):
+        self._keywords = tuple(sorted(set(keywords) - {''}))
+        self._automaton = None
+        
+        if self._keywords and ahocorasick is not None:
+            self._automaton = ahocorasick.Automaton()
+            for keyword in self._keywords:
+                self._automaton.add_word(keyword, keyword)
+            self._automaton.make_automaton()
+    
+    def matches(self, text: str) -> Set[str]:
+        """Return the keywords that occur anywhere in text"""
+        # The automaton reports every occurrence, overlapping ones included
+        if self._automaton is not None:
+            return {keyword for _, keyword in self._automaton.iter(text)}
+        
+        # str.__contains__ is a fast C search; an alternation regex tried at every position is ~5x slower
+        return {keyword for keyword in self._keywords if keyword in text}
+
+
+# Frozen copies for C-level set intersections against the keywords found on a page
+SCAM_KEYWORD_SET = frozenset(SCAM_KEYWORDS)
+EMBASSY_KEYWORD_SET = frozenset(EMBASSY_KEYWORDS)
+
+
+@lru_cache(maxsize=32)
+def _goal_matcher(main_website_goal: str) -> Tuple[Counter, KeywordMatcher]:
+    """Count the words of the website goal and compile one matcher for them and the content keywords
+    
+    A single matcher lets the fallback analysis find every kind of keyword in one scan of the page.
+    """
+    goal_words = Counter(main_website_goal.lower().split())
+    return goal_words, KeywordMatcher(SCAM_KEYWORDS + EMBASSY_KEYWORDS + list(goal_words))
+
+
+class HostRateLimiter:
+    """Thread-safe limiter that spaces requests to the same host by a fixed delay
+    and caps how many requests to that host are in flight at once
+    
+    Every request of a run passes through its limiter, so stopping the limiter stops the run.
+    """
+    
+    def __init__(self, delay: float, max_per_host: int = 8):
+        self.delay = delay
+        self.max_per_host = max(1, max_per_host)
+        self._next_slot: Dict[str, float] = {}
+        self._in_flight: Dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+    
+    def stop(self):
+        """Make every waiting and later slot() raise KeyboardInterrupt, for good"""
+        self._stopped.set()
+    
+    @contextmanager
+    def slot(self, url: str):
+        """Hold one of the host's concurrent request slots, starting no earlier than its next free time"""
+        host = urlparse(url).netloc
+        with self._lock:
+            in_flight = self._in_flight.setdefault(host, threading.BoundedSemaphore(self.max_per_host))
+        
+        with in_flight:
+            self._wait_for_host(host)
+            yield
+    
+    def _wait_for_host(self, host: str):
+        """Sleep only for what is left of the host's delay since its previous request was scheduled"""
+        if self._stopped.is_set():
+            raise KeyboardInterrupt("link check stopped")
+        if self.delay <= 0:
+            return
+        
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = slot + self.delay
+        
+        if slot > now and self._stopped.wait(slot - now):
+            raise KeyboardInterrupt("link check stopped")
+
+
+@contextmanager
+def _interruptible_pool(max_workers: int, rate_limiter: HostRateLimiter) -> Iterator[ThreadPoolExecutor]:
+    """ThreadPoolExecutor that, when interrupted, stops rate_limiter and drops queued work instead of
+    waiting for it
+    
+    KeyboardInterrupt only reaches the main thread; stopping the limiter passes it on to the workers,
+    whose requests then raise it too, so each pool above them is interrupted in turn.
+    """
+    pool = ThreadPoolExecutor(max_workers=max_workers)
+    interrupted = False
+    try:
+        yield pool
+    except KeyboardInterrupt:
+        rate_limiter.stop()
+        interrupted = True
+        raise
+    finally:
+        pool.shutdown(wait=not interrupted, cancel_futures=interrupted)
+
+
+# Structured output schemas, so the model can only answer with the fields the analysis reads
+ANALYSIS_PROPERTIES = {
+    'relevance_score': {'type': 'integer'},
+    'is_suspicious': {'type': 'boolean'},
+    'reasons': {'type': 'array', 'items': {'type': 'string'}},
+    'summary': {'type': 'string'},
+}
+
+ANALYSIS_RESPONSE_FORMAT = {
+    'type': 'json_schema',
+    'json_schema': {
+        'name': 'page_analysis',
+        'strict': True,
+        'schema': {
+            'type': 'object',
+            'properties': ANALYSIS_PROPERTIES,
+            'required': list(ANALYSIS_PROPERTIES),
+            'additionalProperties': False,
+        },
+    },
+}
+
+BATCH_ANALYSIS_RESPONSE_FORMAT = {
+    'type': 'json_schema',
+    'json_schema': {
+        'name': 'page_analyses',
+        'strict': True,
+        'schema': {
+            'type': 'object',
+            'properties': {
+                'results': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'object',
+                        'properties': {'id': {'type': 'integer'}, **ANALYSIS_PROPERTIES},
+                        'required': ['id', *ANALYSIS_PROPERTIES],
+                        'additionalProperties': False,
+                    },
+                },
+            },
+            'required': ['results'],
+            'additionalProperties': False,
+        },
+    },
+}
+
+
+def _normalize_analysis(raw) -> Optional[Dict[str, any]]:
+    """Coerce a model answer into the analysis fields, or None if it does not have them"""
+    if not isinstance(raw, dict):
+        return None
+    
+    score, suspicious, reasons = raw.get('relevance_score'), raw.get('is_suspicious'), raw.get('reasons', [])
+    if isinstance(score, bool) or not isinstance(score, (int, float)) or not isinstance(suspicious, bool):
+        return None
+    if not isinstance(reasons, list):
+        reasons = [reasons]
+    
+    return {
+        "relevance_score": min(10, max(1, int(score))),
+        "is_suspicious": suspicious,
+        "reasons": [str(reason) for reason in reasons],
+        "summary": str(raw.get('summary') or ''),
+    }
+
+
 class ContentAnalyzer:
     """AI-powered content analyzer for scam detection and relevance checking"""
     
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, model: str = "gpt-4o-mini",
+                 batch_size: int = 10, max_concurrent_batches: int = 4):
         self.api_key = api_key or os.getenv('OPENAI_API_KEY')
-        if self.api_key:
-            openai.api_key = self.api_key
+        self.model = model
+        self.batch_size = max(1, batch_size)
+        self.max_concurrent_batches = max(1, max_concurrent_batches)
+        # One client for all checks, so worker threads share its connection pool
+        self.client = openai.OpenAI(api_key=self.api_key) if self.api_key else None
+        # Cleared if the model rejects json_schema, so older models fall back to plain JSON mode
+        self._structured_outputs = True
+        self._cache: OrderedDict[bytes, Dict[str, any]] = OrderedDict()
+        self._cache_lock = threading.Lock()
+    
+    def _cache_key(self, content: str, main_website_goal: str) -> bytes:
+        """Hash the part of content the analysis actually reads, together with the goal"""
+        seen = content[:AI_CONTENT_CHARS] if self.api_key else content
+        digest = hashlib.blake2b(seen.encode(), digest_size=16)
+        digest.update(b'\0' + main_website_goal.encode())
+        return digest.digest()
+    
+    def _cached_analysis(self, key: bytes) -> Optional[Dict[str, any]]:
+        """Return a previous analysis for key, marking it recently used"""
+        with self._cache_lock:
+            analysis = self._cache.get(key)
+            if analysis is not None:
+                self._cache.move_to_end(key)
+            return analysis
+    
+    def _store_analysis(self, key: bytes, analysis: Dict[str, any]):
+        """Remember an analysis, evicting the least recently used one when full"""
+        with self._cache_lock:
+            self._cache[key] = analysis
+            if len(self._cache) > ANALYSIS_CACHE_SIZE:
+                self._cache.popitem(last=False)
+    
+    def _response_format(self, structured: Dict[str, any]) -> Dict[str, any]:
+        """Return the structured output format, or plain JSON mode for models without it"""
+        return structured if self._structured_outputs else {"type": "json_object"}
+    
+    def _disable_structured_outputs(self, error: openai.BadRequestError, sent_format: Dict[str, any]) -> bool:
+        """Switch to plain JSON mode after the model rejects json_schema; True if the request should be retried
+        
+        Every request that was sent with json_schema is retried, including ones that were already in flight
+        when another request switched the analyzer over.
+        """
+        if sent_format.get('type') != 'json_schema' or 'response_format' not in str(error):
+            return False
+        if self._structured_outputs:
+            self._structured_outputs = False
+            logging.warning(f"Model {self.model} does not support structured outputs, using JSON mode")
+        return True
     
     def analyze_content(self, content: str, main_website_goal: str) -> Dict[str, any]:
-        """Analyze content for scam indicators and relevance to main website goal"""
+        """Analyze content for scam indicators and relevance to main website goal, once per distinct page"""
+        key = self._cache_key(content, main_website_goal)
+        analysis = self._cached_analysis(key)
+        if analysis is None:
+            analysis = self._analyze_uncached(content, main_website_goal)
+            self._store_analysis(key, analysis)
+        return analysis
+    
+    def _analyze_uncached(self, content: str, main_website_goal: str) -> Dict[str, any]:
+        """Analyze one page with a single AI request, or with keywords when no API key is set"""
         if not self.api_key:
             return self._fallback_analysis(content, main_website_goal)
         
+        # Kept per request: concurrent requests may switch the analyzer to JSON mode while this one is in flight
+        response_format = self._response_format(ANALYSIS_RESPONSE_FORMAT)
         try:
             prompt = f"""Analyze this webpage content for relevance and suspicious activity:
 
 Main Website Goal: {main_website_goal}
-Content: {content[:2000]}
+Content: {content[:AI_CONTENT_CHARS]}
 
 Respond in JSON format:
 {{
@@ -94,45 +537,128 @@ Respond in JSON format:
     "summary": "brief summary"
 }}"""
             
-            response = openai.chat.completions.create(
-                model="gpt-4",
+            response = self.client.chat.completions.create(
+                model=self.model,
                 messages=[{"role": "user", "content": prompt}],
-                temperature=0.3
+                temperature=0.3,
+                response_format=response_format
             )
             
-            return json.loads(response.choices[0].message.content)
+            analysis = _normalize_analysis(orjson.loads(response.choices[0].message.content))
+            if analysis is None:
+                raise ValueError("response is missing analysis fields")
+            return analysis
             
+        except openai.BadRequestError as e:
+            if self._disable_structured_outputs(e, response_format):
+                return self._analyze_uncached(content, main_website_goal)
+            logging.error(f"AI analysis failed: {e}")
+            return self._fallback_analysis(content, main_website_goal)
         except Exception as e:
             logging.error(f"AI analysis failed: {e}")
             return self._fallback_analysis(content, main_website_goal)
     
-    def _fallback_analysis(self, content: str, main_website_goal: str) -> Dict[str, any]:
-        """Fallback analysis using keyword matching"""
-        content_lower = content.lower()
-        
-        # Scam indicators
-        scam_keywords = [
-            'get rich quick', 'guaranteed money', 'click here now',
-            'limited time offer', 'act now', 'free money',
-            'congratulations you won', 'urgent action required',
-            'online casino', 'paypal casino', 'casino bonus', 'casino mit paypal',
-            'paypal online casinos', 'fintech news', 'seröse expertenmeinungen',
-            'vertrauenswürdigsten paypal online casinos', 'ppc24'
-        ]
+    def analyze_content_batch(self, items: List[Tuple[str, str]]) -> List[Dict[str, any]]:
+        """Analyze many (content, main_website_goal) pairs, sending batch_size pages per AI request
         
-        # Embassy/Mozambique relevance keywords
-        embassy_keywords = [
-            'embassy', 'consulate', 'mozambique', 'maputo', 'visa', 'passport',
-            'diplomatic', 'consular', 'embassy services', 'citizen services',
-            'travel document', 'mozambican', 'diplomatic mission'
-        ]
+        Pages already analyzed, or repeated within items, are answered from the cache.
+        """
+        keys = [self._cache_key(content, goal) for content, goal in items]
+        analyses = {key: self._cached_analysis(key) for key in keys}
+        
+        # Each distinct uncached page is analyzed once
+        uncached = {key: item for key, item in zip(keys, items) if analyses[key] is None}
+        if not self.api_key:
+            fresh = [self._fallback_analysis(content, goal) for content, goal in uncached.values()]
+        else:
+            todo = list(uncached.values())
+            batches = [todo[start:start + self.batch_size] for start in range(0, len(todo), self.batch_size)]
+            fresh = []
+            if batches:
+                for batch_analyses in asyncio.run(self._analyze_batches(batches)):
+                    fresh.extend(batch_analyses)
+        
+        for key, analysis in zip(uncached, fresh):
+            self._store_analysis(key, analysis)
+            analyses[key] = analysis
+        return [analyses[key] for key in keys]
+    
+    async def _analyze_batches(self, batches: List[List[Tuple[str, str]]]) -> List[List[Dict[str, any]]]:
+        """Send all batches concurrently, at most max_concurrent_batches requests at a time"""
+        # The async client is bound to this event loop, so it lives only as long as the call
+        async with openai.AsyncOpenAI(api_key=self.api_key) as client:
+            limit = asyncio.Semaphore(self.max_concurrent_batches)
+            
+            async def analyze(batch):
+                async with limit:
+                    return await self._analyze_batch(client, batch)
+            
+            return await asyncio.gather(*(analyze(batch) for batch in batches))
+    
+    async def _analyze_batch(self, client: openai.AsyncOpenAI, items: List[Tuple[str, str]]) -> List[Dict[str, any]]:
+        """Analyze one batch of pages with a single AI request"""
+        # Kept per request: concurrent batches may switch the analyzer to JSON mode while this one is in flight
+        response_format = self._response_format(BATCH_ANALYSIS_RESPONSE_FORMAT)
+        try:
+            pages = "\n\n".join(
+                f"Page {page_id}:\nMain Website Goal: {goal}\nContent: {content[:AI_CONTENT_CHARS]}"
+                for page_id, (content, goal) in enumerate(items)
+            )
+            prompt = f"""Analyze each of these webpages for relevance and suspicious activity:
+
+{pages}
+
+Respond in JSON format, with one entry per page:
+{{
+    "results": [
+        {{
+            "id": <page number>,
+            "relevance_score": <1-10>,
+            "is_suspicious": <true/false>,
+            "reasons": ["reason1", "reason2"],
+            "summary": "brief summary"
+        }}
+    ]
+}}"""
+            
+            response = await client.chat.completions.create(
+                model=self.model,
+                messages=[{"role": "user", "content": prompt}],
+                temperature=0.3,
+                response_format=response_format
+            )
+            
+            by_id = {}
+            for result in orjson.loads(response.choices[0].message.content)['results']:
+                analysis = _normalize_analysis(result)
+                if analysis is not None:
+                    by_id[result.get('id')] = analysis
+            
+        except openai.BadRequestError as e:
+            if self._disable_structured_outputs(e, response_format):
+                return await self._analyze_batch(client, items)
+            logging.error(f"AI batch analysis failed: {e}")
+            by_id = {}
+        except Exception as e:
+            logging.error(f"AI batch analysis failed: {e}")
+            by_id = {}
         
-        suspicious = any(keyword in content_lower for keyword in scam_keywords)
+        # Pages the model skipped fall back to keyword matching individually
+        return [
+            by_id[page_id] if page_id in by_id else self._fallback_analysis(content, goal)
+            for page_id, (content, goal) in enumerate(items)
+        ]
+    
+    def _fallback_analysis(self, content: str, main_website_goal: str) -> Dict[str, any]:
+        """Fallback analysis using keyword matching"""
+        goal_words, matcher = _goal_matcher(main_website_goal)
+        found_keywords = matcher.matches(content.lower())
+        suspicious = not found_keywords.isdisjoint(SCAM_KEYWORD_SET)
         
         # Enhanced relevance check for embassy/mozambique content
-        goal_words = main_website_goal.lower().split()
-        embassy_matches = sum(1 for keyword in embassy_keywords if keyword in content_lower)
-        goal_matches = sum(1 for word in goal_words if word in content_lower)
+        embassy_matches = len(found_keywords & EMBASSY_KEYWORD_SET)
+        # A goal word repeated in the goal counts once per occurrence
+        goal_matches = sum(goal_words[word] for word in found_keywords if word in goal_words)
         
         # Calculate relevance score (1-10)
         relevance_score = min(10, max(1, (embassy_matches * 3) + (goal_matches * 2)))
@@ -155,31 +681,159 @@ Respond in JSON format:
         }
 
 
+class _DrainingStream(httpx.SyncByteStream):
+    """Response body that, when closed, reads on so hishel can finish storing it
+    
+    Reading stops after MAX_PAGE_BYTES in all or HTTP_CACHE_DRAIN_TIMEOUT seconds, and the network
+    response is then closed, leaving the entry incomplete so hishel never serves it and later deletes it.
+    """
+    
+    def __init__(self, stream: httpx.SyncByteStream, upstream: httpx.Response, stored: bool):
+        self._stream = stream
+        self._chunks = iter(stream)
+        self._upstream = upstream
+        self._stored = stored
+        self._read = 0
+    
+    def __iter__(self) -> Iterator[bytes]:
+        # Not yield from, which would close the body along with a consumer that stops early
+        for chunk in self._chunks:
+            self._read += len(chunk)
+            yield chunk
+    
+    def close(self):
+        try:
+            if self._stored:
+                deadline = time.monotonic() + HTTP_CACHE_DRAIN_TIMEOUT
+                for chunk in self._chunks:
+                    self._read += len(chunk)
+                    if self._read > MAX_PAGE_BYTES or time.monotonic() > deadline:
+                        break
+        except httpx.TransportError:
+            pass
+        finally:
+            # Closing the network response here, not in the garbage collector, returns its connection
+            # to the pool while no pool lock is held
+            self._upstream.close()
+            self._stream.close()
+
+
+class _UpstreamTransport(httpx.BaseTransport):
+    """Transport under the cache that keeps non-HTML and oversized responses out of it and remembers,
+    per thread, the network response it last handed up"""
+    
+    def __init__(self, transport: httpx.BaseTransport):
+        self._transport = transport
+        self.last = threading.local()
+    
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        response = self._transport.handle_request(request)
+        if not _is_html(response) or _is_too_large(response):
+            # hishel follows the response's caching headers, so these bodies are never stored
+            response.headers['Cache-Control'] = 'no-store'
+        self.last.response = response
+        return response
+    
+    def close(self):
+        self._transport.close()
+
+
+class _DrainingTransport(httpx.BaseTransport):
+    """Caching transport that finishes each stored response, within limits, when it is closed
+    
+    hishel stores a response while it is streamed. A stream left partly read, as _read_html_body leaves
+    them, is otherwise only closed by the garbage collector, which can run while httpcore holds its
+    pool lock and deadlock the client; reading on also keeps truncated bodies out of the cache.
+    """
+    
+    def __init__(self, transport: httpx.BaseTransport, storage: 'hishel.SyncSqliteStorage'):
+        self._upstream = _UpstreamTransport(transport)
+        self._transport = SyncCacheTransport(next_transport=self._upstream, storage=storage)
+    
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        self._upstream.last.response = None
+        response = self._transport.handle_request(request)
+        upstream = self._upstream.last.response
+        # Responses served straight from the cache never touched the network
+        if upstream is not None:
+            response.stream = _DrainingStream(response.stream, upstream,
+                                              bool(response.extensions.get('hishel_stored')))
+        return response
+    
+    def close(self):
+        self._transport.close()
+
+
+def create_http_client(workers: int = 16, cache_dir: Optional[Path] = None) -> httpx.Client:
+    """Create configured HTTP client with HTTP/2, compression and pooled keep-alive connections
+    
+    With cache_dir and hishel installed, responses are cached there so re-runs over the same site
+    skip the network; Cache-Control and ETag revalidation are honored. Only HTML pages up to
+    MAX_PAGE_BYTES are cached, and those are downloaded in full even when only their start is read.
+    """
+    # Room for every worker plus the crawler; HTTP/2 multiplexes same-host requests further
+    transport = httpx.HTTPTransport(
+        http2=True,
+        limits=httpx.Limits(max_connections=max(POOL_MAX_CONNECTIONS, workers * 2),
+                            max_keepalive_connections=POOL_MAX_KEEPALIVE)
+    )
+    if cache_dir is not None and hishel is not None:
+        storage = hishel.SyncSqliteStorage(
+            database_path=Path(cache_dir) / HTTP_CACHE_FILE, default_ttl=HTTP_CACHE_TTL
+        )
+        transport = _DrainingTransport(transport, storage)
+    
+    return httpx.Client(
+        transport=transport,
+        follow_redirects=True,
+        timeout=10.0,
+        headers={
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+            # Prefer HTML, but keep */* so servers do not answer 406 for links to other media
+            'Accept': 'text/html,application/xhtml+xml,*/*;q=0.8'
+        }
+    )
+
+
 class MultiLanguageLinkChecker:
     """Enhanced link checker with multi-language support"""
     
-    def __init__(self, base_url: str, max_depth: int = 2, delay: float = 1.0, output_dir: str = "reports"):
+    def __init__(self, base_url: str, max_depth: int = 2, delay: float = 1.0, output_dir: str = "reports",
+                 workers: int = 16, max_per_host: int = 8, ai_model: str = "gpt-4o-mini",
+                 http_cache: bool = False, client: Optional[httpx.Client] = None,
+                 openai_key: Optional[str] = None, rate_limiter: Optional[HostRateLimiter] = None):
         self.base_url = base_url
-        self.base_domain = urlparse(base_url).netloc
+        self.base_domain = urlsplit(_canonical(base_url)).netloc
         self.max_depth = max_depth
         self.delay = delay
+        self.workers = max(1, workers)
         self.output_dir = Path(output_dir)
-        self.session = self._create_session()
-        self.visited_links = set()
+        self.output_dir.mkdir(exist_ok=True)
+        # A client passed in is shared with other checkers, e.g. by run_batch
+        self.client = client or self._create_client(http_cache)
+        self.rate_limiter = rate_limiter or HostRateLimiter(delay, max_per_host)
+        self.link_cache: Dict[int, Optional[LinkResult]] = {}
+        # Links being checked by one language pass, so concurrent passes wait instead of re-checking them
+        self._link_claims: Dict[int, threading.Event] = {}
+        self._claims_lock = threading.Lock()
         self.main_website_goal = ""
-        self.content_analyzer = ContentAnalyzer()
+        # Goal of each crawled homepage, keyed by its canonical URL
+        self.website_goals: Dict[str, str] = {}
+        self.content_analyzer = ContentAnalyzer(api_key=openai_key, model=ai_model)
         self.detected_languages: List[LanguageVersion] = []
+        self._homepage: Optional[Tuple[bytes, BeautifulSoup]] = None
         
-        self.output_dir.mkdir(exist_ok=True)
         self._setup_logging()
     
-    def _create_session(self) -> requests.Session:
-        """Create configured requests session"""
-        session = requests.Session()
-        session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        })
-        return session
+    def _create_client(self, http_cache: bool = False) -> httpx.Client:
+        """Create this checker's own HTTP client, caching responses in HTTP_CACHE_DIR if http_cache is set"""
+        return create_http_client(self.workers, HTTP_CACHE_DIR if http_cache else None)
+    
+    def _fetch_html(self, url: str, max_bytes: int = MAX_PAGE_BYTES) -> Optional[bytes]:
+        """Fetch up to max_bytes of an HTML page, or None if the URL serves another content type"""
+        with self.rate_limiter.slot(url), self.client.stream('GET', url) as response:
+            response.raise_for_status()
+            return _read_html_body(response, max_bytes)
     
     def _setup_logging(self):
         """Setup logging configuration"""
@@ -187,39 +841,29 @@ class MultiLanguageLinkChecker:
             level=logging.INFO,
             format='%(asctime)s - %(levelname)s - %(message)s'
         )
+        # httpx logs every request at INFO, which would drown the progress messages
+        logging.getLogger('httpx').setLevel(logging.WARNING)
         self.logger = logging.getLogger(__name__)
     
     def detect_languages(self, soup: BeautifulSoup) -> List[LanguageVersion]:
         """Detect available languages from language switcher"""
         languages = []
+        seen_codes = set()
         
-        # Common language switcher patterns
-        selectors = [
-            'a[href*="lang="]',
-            '.language-switcher a',
-            '.lang-switcher a',
-            '.qtranxs_language_chooser a',
-            '.language-selector a'
-        ]
-        
-        for selector in selectors:
-            lang_links = soup.select(selector)
-            if lang_links:
-                for link in lang_links:
-                    href = link.get('href', '')
-                    if 'lang=' in href:
-                        try:
-                            params = parse_qs(urlparse(href).query)
-                            if 'lang' in params:
-                                lang_code = params['lang'][0]
-                                lang_name = link.get_text(strip=True) or lang_code
-                                full_url = urljoin(self.base_url, href)
-                                
-                                if not any(l.code == lang_code for l in languages):
-                                    languages.append(LanguageVersion(lang_code, lang_name, full_url))
-                        except Exception as e:
-                            self.logger.warning(f"Error parsing language link {href}: {e}")
-                break
+        for link in LANGUAGE_LINK_SELECTOR.select(soup):
+            href = link.get('href', '')
+            if 'lang=' in href:
+                try:
+                    params = parse_qs(urlparse(href).query)
+                    if 'lang' in params and params['lang'][0] not in seen_codes:
+                        lang_code = params['lang'][0]
+                        lang_name = link.get_text(strip=True) or lang_code
+                        full_url = urljoin(self.base_url, href)
+                        
+                        seen_codes.add(lang_code)
+                        languages.append(LanguageVersion(lang_code, lang_name, full_url))
+                except Exception as e:
+                    self.logger.warning(f"Error parsing language link {href}: {e}")
         
         # Fallback to default if no languages detected
         if not languages:
@@ -230,7 +874,7 @@ class MultiLanguageLinkChecker:
     def extract_main_goal(self, soup: BeautifulSoup) -> str:
         """Extract main website goal from homepage"""
         # Get meta description first
-        meta_desc = soup.find('meta', attrs={'name': 'description'})
+        meta_desc = META_DESCRIPTION_SELECTOR.select_one(soup)
         if meta_desc:
             return meta_desc.get('content', '')[:500]
         
@@ -246,126 +890,281 @@ class MultiLanguageLinkChecker:
         
         return goal_text.strip()[:500]
     
-    def get_all_links(self, url: str, depth: int = 0) -> List[Tuple[str, str]]:
-        """Extract all links from a webpage"""
-        if depth > self.max_depth or url in self.visited_links:
-            return []
+    def get_all_links(self, url: str,
+                      homepage: Optional[Tuple[bytes, BeautifulSoup]] = None) -> Iterator[Tuple[str, str]]:
+        """Crawl breadth-first from url, yielding each (title, link) pair once as it is found
         
-        self.visited_links.add(url)
-        links = []
+        homepage is an already fetched (content, soup) pair for url, used instead of fetching it again.
+        """
+        # Pages are marked visited when queued, so the queue never holds the same page twice.
+        # URLs are remembered by their 64-bit _url_key, which keeps memory flat on large crawls;
+        # the sets are local so language passes can crawl concurrently
+        start_url = _canonical(url)
+        queue = deque([(start_url, 0)])
+        visited_links: Set[int] = {_url_key(start_url)}
+        yielded_links: Set[int] = set()
         
-        try:
-            response = self.session.get(url, timeout=10)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Extract main goal and detect languages from homepage
-            if depth == 0:
-                self.main_website_goal = self.extract_main_goal(soup)
-                self.detected_languages = self.detect_languages(soup)
-                self.logger.info(f"Main website goal: {self.main_website_goal[:100]}...")
-                self.logger.info(f"Detected languages: {[lang.code for lang in self.detected_languages]}")
-            
-            # Find all links
-            for link in soup.find_all('a', href=True):
-                href = link.get('href')
-                title = link.get_text(strip=True) or link.get('title', '') or href
-                full_url = urljoin(url, href)
+        with _interruptible_pool(self.workers, self.rate_limiter) as pool:
+            while queue:
+                # Pages of one crawl level do not depend on each other, so they are fetched concurrently
+                level = list(queue)
+                queue.clear()
+                
+                fetches = {
+                    page_url: pool.submit(self._fetch_crawl_page, page_url)
+                    for page_url, depth in level if not (depth == 0 and homepage is not None)
+                }
                 
-                if full_url.startswith(('http://', 'https://')):
-                    links.append((title, full_url))
+                for page_url, depth in level:
+                    if depth == 0 and homepage is not None:
+                        content, soup = homepage
+                    else:
+                        content, soup = fetches[page_url].result(), None
+                    if content is None:
+                        continue
                     
-                    # Recursively get links from same domain
-                    if depth < self.max_depth and urlparse(full_url).netloc == self.base_domain:
-                        links.extend(self.get_all_links(full_url, depth + 1))
-            
-            time.sleep(self.delay)
-            
+                    try:
+                        # Extract main goal from the homepage; languages are detected only on the first crawl,
+                        # since every language version shares the same switcher
+                        if depth == 0:
+                            if soup is None:
+                                soup = BeautifulSoup(content, 'lxml')
+                            goal = self.website_goals[start_url] = self.extract_main_goal(soup)
+                            self.main_website_goal = self.main_website_goal or goal
+                            self.logger.info(f"Main website goal: {goal[:100]}...")
+                            if not self.detected_languages:
+                                self.detected_languages = self.detect_languages(soup)
+                                self.logger.info(f"Detected languages: {[lang.code for lang in self.detected_languages]}")
+                        
+                        # Find all links
+                        for href, title in _extract_anchors(content):
+                            full_url = _canonical(urljoin(page_url, href))
+                            if not full_url.startswith(('http://', 'https://')):
+                                continue
+                            
+                            key = _url_key(full_url)
+                            if key not in yielded_links:
+                                yielded_links.add(key)
+                                yield title, full_url
+                            
+                            # Queue same-domain pages for the next crawl level
+                            if (depth < self.max_depth and key not in visited_links
+                                    and urlparse(full_url).netloc == self.base_domain):
+                                visited_links.add(key)
+                                queue.append((full_url, depth + 1))
+                        
+                    except Exception as e:
+                        self.logger.error(f"Error extracting links from {page_url}: {e}")
+    
+    def _fetch_crawl_page(self, page_url: str) -> Optional[bytes]:
+        """Fetch a page to crawl, logging failures instead of raising"""
+        try:
+            return self._fetch_html(page_url)
         except Exception as e:
-            self.logger.error(f"Error extracting links from {url}: {e}")
-        
-        return links
+            self.logger.error(f"Error extracting links from {page_url}: {e}")
+            return None
     
     def check_link(self, title: str, url: str, language: str = "unknown") -> Optional[LinkResult]:
-        """Check individual link for issues"""
-        try:
-            response = self.session.get(url, timeout=10)
-            
-            if response.status_code >= 400:
-                return LinkResult(
-                    title=title, url=url, status="BROKEN",
-                    reason=f"HTTP {response.status_code}", language=language
-                )
-            
-            # Analyze content
-            soup = BeautifulSoup(response.content, 'html.parser')
-            for script in soup(["script", "style"]):
-                script.decompose()
-            
-            content = soup.get_text()
+        """Check individual link for issues, reusing results from other language passes"""
+        hit, result = self._cached_result(title, url, language)
+        if hit:
+            return result
+        
+        result, content = self._fetch_link(title, url, language)
+        if content is not None:
             analysis = self.content_analyzer.analyze_content(content, self.main_website_goal)
+            result = self._analysis_result(title, url, language, analysis)
+        
+        self.link_cache[_url_key(_canonical(url))] = result
+        return result
+    
+    def _cached_result(self, title: str, url: str, language: str) -> Tuple[bool, Optional[LinkResult]]:
+        """Return (True, result) if url was already checked, relabelled for this link and language"""
+        key = _url_key(_canonical(url))
+        if key not in self.link_cache:
+            return False, None
+        
+        cached = self.link_cache[key]
+        return True, replace(cached, title=title, language=language) if cached else None
+    
+    def _fetch_link(self, title: str, url: str, language: str) -> Tuple[Optional[LinkResult], Optional[str]]:
+        """Fetch a link, returning (issue, None) for failures or (None, page text) when content needs analysis"""
+        try:
+            # HEAD first so broken links are reported without downloading their body; the follow-up GET
+            # shares the same rate limiter slot, so a link waits out the host's delay once, not twice
+            with self.rate_limiter.slot(url):
+                head = self.client.head(url)
+                if head.status_code >= 400 and head.status_code not in HEAD_UNSUPPORTED_CODES:
+                    return LinkResult(
+                        title=title, url=url, status="BROKEN",
+                        reason=f"HTTP {head.status_code}", language=language
+                    ), None
+                
+                # A working link that HEAD reports as a document, image, media file or oversized page
+                # needs no GET at all
+                if head.status_code < 400 and (not _is_html(head) or _is_too_large(head)):
+                    return None, None
+                
+                with self.client.stream('GET', url) as response:
+                    if response.status_code >= 400:
+                        return LinkResult(
+                            title=title, url=url, status="BROKEN",
+                            reason=f"HTTP {response.status_code}", language=language
+                        ), None
+                    if _is_too_large(response):
+                        return None, None
+                    body = _read_html_body(response, MAX_BODY_BYTES)
             
-            issues = []
-            if analysis['is_suspicious']:
-                issues.append(f"SUSPICIOUS: {', '.join(analysis['reasons'])}")
-            if analysis['relevance_score'] < 4:
-                issues.append(f"LOW RELEVANCE: Score {analysis['relevance_score']}/10")
-            
-            if issues:
-                return LinkResult(
-                    title=title, url=url, status="FLAGGED",
-                    reason="; ".join(issues), content_snippet=analysis['summary'],
-                    language=language
-                )
+            # Non-HTML links (documents, images, media) only need their status checked
+            if body is None:
+                return None, None
             
-            return None
+            return None, _extract_text(body)
             
-        except requests.exceptions.Timeout:
-            return LinkResult(title=title, url=url, status="TIMEOUT", reason="Request timeout", language=language)
-        except requests.exceptions.ConnectionError:
-            return LinkResult(title=title, url=url, status="CONNECTION_ERROR", reason="Connection failed", language=language)
+        except httpx.TimeoutException:
+            return LinkResult(title=title, url=url, status="TIMEOUT", reason="Request timeout", language=language), None
+        except (httpx.NetworkError, httpx.RemoteProtocolError):
+            return LinkResult(title=title, url=url, status="CONNECTION_ERROR", reason="Connection failed", language=language), None
         except Exception as e:
-            return LinkResult(title=title, url=url, status="ERROR", reason=str(e), language=language)
+            return LinkResult(title=title, url=url, status="ERROR", reason=str(e), language=language), None
+    
+    def _analysis_result(self, title: str, url: str, language: str, analysis: Dict[str, any]) -> Optional[LinkResult]:
+        """Turn a content analysis into a FLAGGED result, or None if the content looks fine"""
+        issues = []
+        if analysis['is_suspicious']:
+            issues.append(f"SUSPICIOUS: {', '.join(analysis['reasons'])}")
+        if analysis['relevance_score'] < 4:
+            issues.append(f"LOW RELEVANCE: Score {analysis['relevance_score']}/10")
+        
+        if issues:
+            return LinkResult(
+                title=title, url=url, status="FLAGGED",
+                reason="; ".join(issues), content_snippet=analysis['summary'],
+                language=language
+            )
+        
+        return None
+    
+    def _claim_link(self, url: str) -> Tuple[threading.Event, bool]:
+        """Return (event, True) if the caller should check url, or (event, False) if another pass is"""
+        key = _url_key(_canonical(url))
+        with self._claims_lock:
+            if key in self._link_claims:
+                return self._link_claims[key], False
+            event = self._link_claims[key] = threading.Event()
+            return event, True
     
     def analyze_language_version(self, language: LanguageVersion) -> List[LinkResult]:
         """Analyze a specific language version of the website"""
         self.logger.info(f"Starting analysis of {language.name} ({language.code})")
-        self.visited_links.clear()
         
-        all_links = self.get_all_links(language.url)
-        self.logger.info(f"Found {len(all_links)} links for {language.name}")
+        results: Dict[int, Optional[LinkResult]] = {}
+        pending: List[Tuple[int, str, str, str]] = []
+        claimed: List[threading.Event] = []
+        borrowed: List[Tuple[int, str, str, threading.Event]] = []
         
-        problematic_links = []
-        for i, (title, url) in enumerate(all_links, 1):
-            self.logger.info(f"Checking {i}/{len(all_links)}: {url}")
-            
-            result = self.check_link(title, url, language.code)
-            if result:
-                problematic_links.append(result)
-                self.logger.warning(f"Issue found: {result.status} - {result.reason}")
+        try:
+            # Links are fetched concurrently while the crawl is still discovering new ones;
+            # HostRateLimiter keeps each host at one request per delay
+            with _interruptible_pool(self.workers, self.rate_limiter) as pool:
+                futures = {}
+                # The homepage fetched for language detection starts the crawl of its own language
+                homepage = self._homepage if language.url == self.base_url else None
+                for index, (title, url) in enumerate(self.get_all_links(language.url, homepage)):
+                    hit, result = self._cached_result(title, url, language.code)
+                    if hit:
+                        results[index] = result
+                        continue
+                    
+                    event, owned = self._claim_link(url)
+                    if owned:
+                        claimed.append(event)
+                        futures[pool.submit(self._fetch_link, title, url, language.code)] = (index, title, url)
+                    else:
+                        borrowed.append((index, title, url, event))
+                self.logger.info(f"Found {len(results) + len(futures) + len(borrowed)} links for {language.name} "
+                                 f"({len(results)} already checked, {len(borrowed)} checked by other languages)")
+                
+                for i, future in enumerate(as_completed(futures), 1):
+                    index, title, url = futures[future]
+                    self.logger.info(f"Checked {i}/{len(futures)}: {url}")
+                    
+                    result, content = future.result()
+                    if content is not None:
+                        pending.append((index, title, url, content))
+                    else:
+                        results[index] = self.link_cache[_url_key(_canonical(url))] = result
             
-            time.sleep(self.delay)
+            # Pages that loaded are analyzed together: several pages per AI request, several requests at once
+            self.logger.info(f"Analyzing content of {len(pending)} pages")
+            goal = self.website_goals.get(_canonical(language.url), self.main_website_goal)
+            analyses = self.content_analyzer.analyze_content_batch(
+                [(content, goal) for _, _, _, content in pending]
+            )
+            for (index, title, url, _), analysis in zip(pending, analyses):
+                results[index] = self.link_cache[_url_key(_canonical(url))] = self._analysis_result(
+                    title, url, language.code, analysis
+                )
+        finally:
+            # Wake passes waiting on our links, even when this pass failed part way
+            for event in claimed:
+                event.set()
+        
+        # Links claimed by another pass are taken from the cache once that pass is done with them;
+        # our own claims are released above first, so two passes never wait on each other
+        for index, title, url, event in borrowed:
+            event.wait()
+            hit, result = self._cached_result(title, url, language.code)
+            results[index] = result if hit else self.check_link(title, url, language.code)
         
+        # Keep report order identical to crawl order
+        problematic_links = [results[index] for index in sorted(results) if results[index]]
+        for result in problematic_links:
+            self.logger.warning(f"Issue found: {result.status} - {result.reason}")
         return problematic_links
     
     def analyze_all_languages(self) -> Dict[str, List[LinkResult]]:
         """Analyze all detected language versions"""
         try:
-            response = self.session.get(self.base_url, timeout=10)
-            soup = BeautifulSoup(response.content, 'html.parser')
+            content = self._fetch_html(self.base_url) or b''
+            soup = BeautifulSoup(content, 'lxml')
             self.detected_languages = self.detect_languages(soup)
             self.main_website_goal = self.extract_main_goal(soup)
+            self._homepage = (content, soup)
         except Exception as e:
             self.logger.error(f"Error detecting languages: {e}")
             self.detected_languages = [LanguageVersion('default', 'Default', self.base_url)]
         
-        results_by_language = {}
-        for language in self.detected_languages:
-            self.logger.info(f"\n=== Analyzing {language.name} ({language.code}) ===\n")
-            results_by_language[language.code] = self.analyze_language_version(language)
-        
-        return results_by_language
+        # Language passes run concurrently and share the client, rate limiter and link cache
+        with _interruptible_pool(max(1, len(self.detected_languages)), self.rate_limiter) as pool:
+            futures = {
+                language.code: pool.submit(self.analyze_language_version, language)
+                for language in self.detected_languages
+            }
+            return {code: future.result() for code, future in futures.items()}
+
+
+# Report styles are identical for every table and document, so they are built once
+REPORT_STYLES = getSampleStyleSheet()
+
+REPORT_TITLE_STYLE = ParagraphStyle('CustomTitle', parent=REPORT_STYLES['Heading1'],
+                                    fontSize=16, textColor=colors.darkblue, alignment=1)
+
+REPORT_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 10),
+    ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+    ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+    ('FONTSIZE', (0, 1), (-1, -1), 8),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black),
+])
+
+
+# Which PDF files generate_reports writes
+REPORT_KINDS = ('per-lang', 'combined', 'both')
 
 
 class PDFReportGenerator:
@@ -376,46 +1175,45 @@ class PDFReportGenerator:
         self.website_url = website_url
         self.output_dir = output_dir
         self.timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        # Table rows built once per result list; reportlab flowables cannot be reused across documents
+        self._table_rows: Dict[int, Tuple[List[LinkResult], List[List[str]]]] = {}
     
-    def generate_reports(self) -> List[str]:
-        """Generate PDF reports"""
+    def generate_reports(self, reports: str = "both") -> List[str]:
+        """Generate the PDF reports selected by reports, one of REPORT_KINDS"""
+        if reports not in REPORT_KINDS:
+            raise ValueError(f"reports must be one of {REPORT_KINDS}, not {reports!r}")
         generated_files = []
         
         # Individual language reports
-        for language_code, results in self.results_by_language.items():
-            filename = self.output_dir / f"link_analysis_{language_code}_{self.timestamp}.pdf"
-            self._generate_single_report(results, language_code, str(filename))
-            generated_files.append(str(filename))
+        if reports in ('per-lang', 'both'):
+            for language_code, results in self.results_by_language.items():
+                filename = self.output_dir / f"link_analysis_{language_code}_{self.timestamp}.pdf"
+                self._generate_single_report(results, language_code, str(filename))
+                generated_files.append(str(filename))
         
         # Combined report
-        combined_filename = self.output_dir / f"link_analysis_combined_{self.timestamp}.pdf"
-        self._generate_combined_report(str(combined_filename))
-        generated_files.append(str(combined_filename))
+        if reports in ('combined', 'both'):
+            combined_filename = self.output_dir / f"link_analysis_combined_{self.timestamp}.pdf"
+            self._generate_combined_report(str(combined_filename))
+            generated_files.append(str(combined_filename))
         
         return generated_files
     
-    def _create_table(self, results: List[LinkResult]) -> Table:
-        """Create formatted table from results"""
-        table_data = [['Title', 'URL', 'Issue']]
-        
-        for result in results:
-            title = (result.title[:50] + "...") if len(result.title) > 50 else result.title
-            url = (result.url[:60] + "...") if len(result.url) > 60 else result.url
-            reason = (result.reason[:80] + "...") if len(result.reason) > 80 else result.reason
-            table_data.append([title, url, reason])
-        
-        table = Table(table_data, colWidths=[2*inch, 2.5*inch, 2.5*inch])
-        table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 10),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 1), (-1, -1), 8),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black),
-        ]))
+    def _create_table(self, results: List[LinkResult]) -> LongTable:
+        """Create formatted table from results, split across pages with the header repeated"""
+        # The cache holds on to results, so its id cannot be reused by another list
+        cached = self._table_rows.get(id(results))
+        if cached is not None and cached[0] is results:
+            table_data = cached[1]
+        else:
+            table_data = [['Title', 'URL', 'Issue']]
+            for result in results:
+                table_data.append([result.display_title, result.display_url, result.display_reason])
+            self._table_rows[id(results)] = (results, table_data)
+        
+        # LongTable lays out rows incrementally, which keeps reports with thousands of links fast
+        table = LongTable(table_data, colWidths=[2*inch, 2.5*inch, 2.5*inch], repeatRows=1, splitByRow=1)
+        table.setStyle(REPORT_TABLE_STYLE)
         
         return table
     
@@ -423,14 +1221,10 @@ class PDFReportGenerator:
         """Generate PDF report for a single language"""
         doc = SimpleDocTemplate(filename, pagesize=A4)
         story = []
-        styles = getSampleStyleSheet()
-        
-        # Title
-        title_style = ParagraphStyle('CustomTitle', parent=styles['Heading1'],
-                                   fontSize=16, textColor=colors.darkblue, alignment=1)
+        styles = REPORT_STYLES
         
         story.extend([
-            Paragraph(f"Link Analysis Report - {language_code.upper()}", title_style),
+            Paragraph(f"Link Analysis Report - {language_code.upper()}", REPORT_TITLE_STYLE),
             Paragraph(f"Website: {self.website_url}", styles['Normal']),
             Paragraph(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", styles['Normal']),
             Spacer(1, 20),
@@ -449,15 +1243,12 @@ class PDFReportGenerator:
         """Generate combined report with all languages"""
         doc = SimpleDocTemplate(filename, pagesize=A4)
         story = []
-        styles = getSampleStyleSheet()
-        
-        title_style = ParagraphStyle('CustomTitle', parent=styles['Heading1'],
-                                   fontSize=16, textColor=colors.darkblue, alignment=1)
+        styles = REPORT_STYLES
         
         total_issues = sum(len(results) for results in self.results_by_language.values())
         
         story.extend([
-            Paragraph("Multi-Language Link Analysis Report", title_style),
+            Paragraph("Multi-Language Link Analysis Report", REPORT_TITLE_STYLE),
             Paragraph(f"Website: {self.website_url}", styles['Normal']),
             Paragraph(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", styles['Normal']),
             Spacer(1, 20),
@@ -486,29 +1277,41 @@ class PDFReportGenerator:
         doc.build(story)
 
 
-def main():
-    """Main CLI interface"""
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command line parser; batch configs use the same option names"""
     parser = argparse.ArgumentParser(description='Multi-language website link checker')
     parser.add_argument('url', help='Website URL to analyze')
     parser.add_argument('--depth', type=int, default=5, help='Maximum crawl depth (default: 5)')
-    parser.add_argument('--delay', type=float, default=1.0, help='Delay between requests (default: 1.0)')
+    parser.add_argument('--delay', type=float, default=1.0, help='Delay between requests to the same host (default: 1.0)')
+    parser.add_argument('--workers', type=int, default=16, help='Number of concurrent link checks (default: 16)')
+    parser.add_argument('--max-per-host', type=int, default=8, help='Maximum concurrent requests to one host (default: 8)')
     parser.add_argument('--output-dir', '-o', default='reports', help='Output directory (default: reports)')
     parser.add_argument('--openai-key', help='OpenAI API key for content analysis')
-    
-    args = parser.parse_args()
-    
-    if args.openai_key:
-        os.environ['OPENAI_API_KEY'] = args.openai_key
-    
+    parser.add_argument('--ai-model', default='gpt-4o-mini', help='OpenAI model for content analysis (default: gpt-4o-mini)')
+    parser.add_argument('--http-cache', action='store_true',
+                        help='Reuse responses from an on-disk HTTP cache across runs (needs hishel)')
+    parser.add_argument('--reports', choices=REPORT_KINDS, default='combined',
+                        help='PDF reports to write: one per language, one combined, or both (default: combined)')
+    return parser
+
+
+def _check_site(args: argparse.Namespace, client: Optional[httpx.Client] = None,
+                rate_limiter: Optional[HostRateLimiter] = None) -> Tuple[Dict[str, List[LinkResult]], List[str]]:
+    """Analyze one website as described by parsed CLI arguments and write its reports"""
     # Run analysis
-    checker = MultiLanguageLinkChecker(args.url, args.depth, args.delay, args.output_dir)
+    checker = MultiLanguageLinkChecker(args.url, args.depth, args.delay, args.output_dir, args.workers,
+                                       max_per_host=args.max_per_host, ai_model=args.ai_model,
+                                       http_cache=args.http_cache, client=client,
+                                       openai_key=args.openai_key, rate_limiter=rate_limiter)
     results_by_language = checker.analyze_all_languages()
     
     # Generate reports
     report_generator = PDFReportGenerator(results_by_language, args.url, checker.output_dir)
-    report_files = report_generator.generate_reports()
-    
-    # Print summary
+    return results_by_language, report_generator.generate_reports(args.reports)
+
+
+def _print_summary(results_by_language: Dict[str, List[LinkResult]], report_files: List[str]):
+    """Print the issues found and the reports written for one website"""
     total_issues = sum(len(results) for results in results_by_language.values())
     print(f"\n=== Analysis Complete ===")
     print(f"Analyzed {len(results_by_language)} language versions")
@@ -526,5 +1329,62 @@ def main():
             print(f"  • ... and {len(results) - 3} more")
 
 
+def run_batch(configs: List[Dict[str, any]], http_cache: bool = False,
+              max_concurrent: int = 4) -> List[Dict[str, List[LinkResult]]]:
+    """Check several websites in one process, sharing one HTTP client, connection pool and rate limiter
+    
+    Each config maps CLI option names (url, depth, delay, output_dir, ...) to values; options left out
+    take their CLI defaults, and each config needs an output_dir of its own. Up to max_concurrent
+    websites are checked at once, and their summaries are printed in config order. Responses are
+    cached in HTTP_CACHE_DIR when http_cache is set; the cache is shared by the whole batch, so a
+    config may only repeat run_batch's http_cache, not override it. Each site keeps its own workers,
+    and the shared connection pool is sized for the largest.
+    """
+    # Options of the client shared by every site, which a single config cannot change
+    batch_options = {'http_cache': http_cache}
+    parser = build_parser()
+    batch = []
+    for config in configs:
+        # Parsing just the URL fills in every default, exactly as the CLI would
+        args = parser.parse_args([config['url']])
+        for key, value in config.items():
+            if not hasattr(args, key):
+                raise ValueError(f"Unknown batch option {key!r}")
+            if key in batch_options and value != batch_options[key]:
+                raise ValueError(f"Option {key!r} applies to the whole batch; pass it to run_batch instead")
+            setattr(args, key, value)
+        batch.append(args)
+    
+    # Report names only tell languages and seconds apart, so sites sharing a directory would overwrite
+    # each other's reports
+    output_dirs = Counter(Path(args.output_dir).resolve() for args in batch)
+    shared = [str(output_dir) for output_dir, count in output_dirs.items() if count > 1]
+    if shared:
+        raise ValueError(f"Batch configs share output_dir {shared[0]}; give each website its own")
+    
+    if not batch:
+        return []
+    
+    # Sites often link to the same hosts, so one limiter with the strictest settings spaces every
+    # request to a host, whichever site it comes from
+    rate_limiter = HostRateLimiter(max(args.delay for args in batch), min(args.max_per_host for args in batch))
+    
+    # Sites are independent and mostly wait on the network, so their crawls overlap
+    with create_http_client(max(args.workers for args in batch), HTTP_CACHE_DIR if http_cache else None) as client, \
+            _interruptible_pool(max(1, min(max_concurrent, len(batch))), rate_limiter) as pool:
+        futures = [pool.submit(_check_site, args, client, rate_limiter) for args in batch]
+        results = []
+        for future in futures:
+            results_by_language, report_files = future.result()
+            _print_summary(results_by_language, report_files)
+            results.append(results_by_language)
+        return results
+
+
+def main(argv: Optional[List[str]] = None):
+    """Main CLI interface; argv defaults to the process arguments"""
+    _print_summary(*_check_site(build_parser().parse_args(argv)))
+
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -138,18 +138,18 @@ def create_comprehensive_demo():
     # Create timestamp for demo reports
     demo_timestamp = datetime.now().strftime("%Y%m%d_%H%M%S") + "_DEMO"
     
+    # One generator serves every language report and the combined report
+    generator = PDFReportGenerator(results_by_language, website_url, output_dir)
+    generator.timestamp = demo_timestamp.replace("_DEMO", "")
+    
     # Generate demo reports with special naming
     for language_code, results in results_by_language.items():
         filename = output_dir / f"comprehensive_demo_{language_code}_{demo_timestamp}.pdf"
-        generator = PDFReportGenerator({language_code: results}, website_url, output_dir)
-        generator.timestamp = demo_timestamp.replace("_DEMO", "")
         generator._generate_single_report(results, language_code, str(filename))
         print(f"Generated: {filename}")
     
     # Generate combined demo report
     combined_filename = output_dir / f"comprehensive_demo_combined_{demo_timestamp}.pdf"
-    generator = PDFReportGenerator(results_by_language, website_url, output_dir)
-    generator.timestamp = demo_timestamp.replace("_DEMO", "")
     generator._generate_combined_report(str(combined_filename))
     print(f"Generated: {combined_filename}")
     
@@ -6,60 +6,165 @@ This script demonstrates how to use CheckLink programmatically
 and provides examples for different use cases.
 """
 
+import argparse
+import hashlib
+import os
+import shlex
+import shutil
 import subprocess
 import sys
+import time
 from pathlib import Path
+from types import MappingProxyType
 
-def run_example(description, command):
-    """Run an example command with description"""
-    print(f"\n{'='*60}")
-    print(f"Example: {description}")
-    print(f"Command: {command}")
+# Built once at import; read-only views over argv tuples, so callers cannot change the examples
+EXAMPLES = tuple(
+    MappingProxyType({"description": description, "argv": tuple(argv)})
+    for description, argv in [
+        ("Quick health check (homepage only)",
+         ["https://example.com", "--depth", "0", "--output-dir", "quick_check"]),
+        ("Embassy website analysis (multi-language)",
+         ["https://ambassademozambiquefrance.fr/?lang=PT", "--depth", "1", "--output-dir", "embassy_analysis",
+          "--delay", "0.5"]),
+        ("Comprehensive analysis with AI",
+         ["https://example.com", "--depth", "2", "--output-dir", "comprehensive_analysis", "--delay", "1.0"]),
+        ("Fast scan for development",
+         ["https://localhost:3000", "--depth", "1", "--delay", "0.1", "--output-dir", "dev_check"]),
+    ]
+)
+
+# checklink.py sits next to this script; isolated children are pointed at it explicitly
+SCRIPT_DIR = Path(__file__).resolve().parent
+
+# Reports of examples run within the TTL are restored from here instead of crawling again
+CACHE_DIR = Path(".checklink_cache")
+CACHE_TTL = float(os.environ.get("CHECKLINK_EXAMPLE_CACHE_TTL", 3600))
+
+def cache_key(config):
+    """Digest of an example's full checklink configuration"""
+    return hashlib.sha256(repr(sorted(config.items())).encode()).hexdigest()
+
+def restore_cached(key, output_dir):
+    """Copy cached reports for key into output_dir; False if there are none younger than CACHE_TTL"""
+    marker = CACHE_DIR / f"{key}.marker"
+    if not marker.exists() or time.time() - marker.stat().st_mtime > CACHE_TTL:
+        return False
+    shutil.copytree(CACHE_DIR / key, output_dir, dirs_exist_ok=True)
+    return True
+
+def store_cached(key, output_dir):
+    """Save the reports in output_dir under key, replacing older ones"""
+    cached = CACHE_DIR / key
+    shutil.rmtree(cached, ignore_errors=True)
+    shutil.copytree(output_dir, cached)
+    (CACHE_DIR / f"{key}.marker").touch()
+
+def select_examples(examples):
+    """Show every example and ask once which of them to run"""
+    for number, example in enumerate(examples, 1):
+        print(f"\n{'='*60}")
+        print(f"Example {number}: {example['description']}")
+        # Quoted, so URLs with '&', '?' or spaces can be pasted into a shell as shown
+        print(f"Command: {shlex.join(['python', 'checklink.py', *example['argv']])}")
     print(f"{'='*60}")
     
-    # Ask for confirmation
-    response = input("Run this example? (y/n): ").lower().strip()
-    if response == 'y':
-        try:
-            subprocess.run(command.split(), check=True)
-        except subprocess.CalledProcessError as e:
-            print(f"Error running command: {e}")
-        except KeyboardInterrupt:
-            print("\nExample interrupted by user")
-    else:
-        print("Example skipped")
+    selection = input("Select examples to run (e.g. 1,3 or 'all'): ").lower().strip()
+    if selection in ('a', 'all'):
+        return list(examples)
+    
+    chosen = set()
+    for token in selection.replace(',', ' ').split():
+        if token.isdigit() and 1 <= int(token) <= len(examples):
+            chosen.add(int(token))
+        else:
+            print(f"Ignoring unknown example: {token}")
+    
+    if not chosen:
+        print("No examples selected")
+    return [example for number, example in enumerate(examples, 1) if number in chosen]
+
+def run_isolated(argv):
+    """Run one example in a child interpreter, so a crash cannot take the other examples down"""
+    # -m runs checklink with this same interpreter instead of whichever python is on PATH;
+    # -u keeps the child from block-buffering its output into the pipe
+    command = [sys.executable, "-u", "-m", "checklink", *argv]
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [str(SCRIPT_DIR), os.environ.get("PYTHONPATH")])))
+    with subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                          bufsize=1, text=True, env=env) as process:
+        # Relay output line by line, so long crawls show progress even when our stdout is redirected
+        for line in process.stdout:
+            sys.stdout.write(line)
+            sys.stdout.flush()
+    if process.returncode:
+        raise subprocess.CalledProcessError(process.returncode, command)
+
+def run_examples(checklink, argvs, use_cache=True, isolated=False):
+    """Run the approved examples as one checklink batch sharing one HTTP client, or each in its own process
+    
+    checklink is the imported checklink module. With use_cache, examples run recently with the same
+    configuration are restored from CACHE_DIR.
+    """
+    try:
+        # Parsing each argv with checklink's own parser turns it into a batch config
+        parser = checklink.build_parser()
+        pending = []
+        for argv in argvs:
+            config = vars(parser.parse_args(argv))
+            key = cache_key(config)
+            if use_cache and restore_cached(key, config["output_dir"]):
+                print(f"Restored cached reports for {config['url']} into {config['output_dir']}")
+            else:
+                pending.append((key, config, argv))
+        
+        if isolated:
+            completed = []
+            for key, config, argv in pending:
+                try:
+                    run_isolated(argv)
+                    completed.append((key, config, argv))
+                except subprocess.CalledProcessError as e:
+                    print(f"Error running command: {e}")
+        else:
+            checklink.run_batch([config for _, config, _ in pending])
+            completed = pending
+        
+        if use_cache:
+            for key, config, _ in completed:
+                store_cached(key, config["output_dir"])
+    except SystemExit as e:
+        # argparse exits on invalid arguments
+        if e.code:
+            print(f"Error running examples: exit status {e.code}")
+    except Exception as e:
+        print(f"Error running examples: {e}")
+    except KeyboardInterrupt:
+        print("\nExamples interrupted by user")
 
 def main():
     """Main example runner"""
     print("CheckLink - Example Usage")
     print("This script shows different ways to use CheckLink")
     
-    # Check if checklink.py exists
-    if not Path("checklink.py").exists():
-        print("Error: checklink.py not found in current directory")
-        sys.exit(1)
+    parser = argparse.ArgumentParser(description='Run CheckLink usage examples')
+    parser.add_argument('--no-cache', action='store_true',
+                        help=f'Run every example again instead of restoring reports cached in {CACHE_DIR}/')
+    parser.add_argument('--isolated', action='store_true',
+                        help='Run each example in its own Python process instead of one in-process batch')
+    args = parser.parse_args()
     
-    examples = [
-        {
-            "description": "Quick health check (homepage only)",
-            "command": "python checklink.py https://example.com --depth 0 --output-dir quick_check"
-        },
-        {
-            "description": "Embassy website analysis (multi-language)",
-            "command": "python checklink.py https://ambassademozambiquefrance.fr/?lang=PT --depth 1 --output-dir embassy_analysis --delay 0.5"
-        },
-        {
-            "description": "Comprehensive analysis with AI",
-            "command": "python checklink.py https://example.com --depth 2 --output-dir comprehensive_analysis --delay 1.0"
-        },
-        {
-            "description": "Fast scan for development",
-            "command": "python checklink.py https://localhost:3000 --depth 1 --delay 0.1 --output-dir dev_check"
-        }
-    ]
+    # Importing up front both checks checklink is available and loads it once for the in-process batch;
+    # it is found next to this script, whatever the current directory
+    try:
+        import checklink
+    except ImportError as e:
+        print(f"Error: checklink could not be imported ({e})")
+        print(f"Install CheckLink's dependencies with: pip install -r {SCRIPT_DIR / 'requirements.txt'}")
+        sys.exit(1)
     
-    for example in examples:
-        run_example(example["description"], example["command"])
+    # One prompt up front, then the approved examples run together
+    approved = [example["argv"] for example in select_examples(EXAMPLES)]
+    if approved:
+        run_examples(checklink, approved, use_cache=not args.no_cache, isolated=args.isolated)
     
     print(f"\n{'='*60}")
     print("Examples completed!")
@@ -67,4 +172,4 @@ def main():
     print(f"{'='*60}")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()